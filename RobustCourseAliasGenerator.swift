@@ -35,6 +35,8 @@ class RobustCourseAliasGenerator {
         "independent study": ["indep", "self-directed", "research"]
     ]
     
+    private static let courseNumberRegex = try! NSRegularExpression(pattern: "\\b([a-z]+)\\s*(\\d{3,4})\\b")
+    
     private let commonFillerWords = [
         "to", "of", "the", "and", "a", "an", "in", "for", "with", "on", "at", "by", "from"
     ]
@@ -142,8 +144,7 @@ class RobustCourseAliasGenerator {
         var aliases = Set<String>()
         
         // Extract course numbers (e.g., "Math 101", "CS 201")
-        let numberRegex = try! NSRegularExpression(pattern: "\\b([a-z]+)\\s*(\\d{3,4})\\b")
-        let matches = numberRegex.matches(in: text, range: NSRange(text.startIndex..., in: text))
+        let matches = Self.courseNumberRegex.matches(in: text, range: NSRange(text.startIndex..., in: text))
         
         for match in matches {
             if let subjectRange = Range(match.range(at: 1), in: text),
@@ -203,6 +203,8 @@ struct ScheduleImportParser {
         )
     }
     
+    private static let timeRangeRegex = try! NSRegularExpression(pattern: "(\\d{1,2}):?(\\d{2})?\\s*([AaPp][Mm])?\\s*-\\s*(\\d{1,2}):?(\\d{2})?\\s*([AaPp][Mm])?", options: [])
+    
     private static func parseScheduleInfo(_ info: String) -> ([DayOfWeek], Date?, Date?) {
         var days: [DayOfWeek] = []
         var startTime: Date?
@@ -240,8 +242,7 @@ struct ScheduleImportParser {
         }
         
         // Parse time ranges like "9:00-10:00", "2:00-4:00", etc.
-        let timeRegex = try! NSRegularExpression(pattern: "(\\d{1,2}):?(\\d{2})?\\s*([AaPp][Mm])?\\s*-\\s*(\\d{1,2}):?(\\d{2})?\\s*([AaPp][Mm])?", options: [])
-        let matches = timeRegex.matches(in: info, options: [], range: NSRange(location: 0, length: info.count))
+        let matches = timeRangeRegex.matches(in: info, options: [], range: NSRange(location: 0, length: info.count))
         
         if let match = matches.first {
             let startHour = extractNumber(from: info, range: match.range(at: 1))
@@ -41,6 +41,11 @@ public final class SmartInputEngine {
     private var courseAliases: [String: String] = defaultCourseAliases()
     private var assignmentAliases: [String: String] = defaultAssignmentAliases()
 
+    // Fallback Regexes (compiled once, not per call)
+    private static let scoreWithKeywordRegex = try! NSRegularExpression(pattern: #"(?:got|scored|received|grade of)\s*([0-9/.]+\s*(?:%|percent)?)"#, options: .caseInsensitive)
+    private static let scoreWithoutKeywordRegex = try! NSRegularExpression(pattern: #"([0-9/.]+\s*(?:%|percent))"#, options: .caseInsensitive)
+    private static let weightRegex = try! NSRegularExpression(pattern: #"(?:worth|weight)\s*([0-9.]+\s*(?:%|percent)?)"#, options: .caseInsensitive)
+
     // MARK: - Initialization
 
     public init() {
@@ -168,22 +173,24 @@ public final class SmartInputEngine {
     // MARK: - Entity Extraction Fallbacks & Helpers
 
     private func extractScore(from text: String) -> String? {
+        // Both patterns need at least one of these characters; skip the regex scan otherwise.
+        guard text.contains(where: "0123456789/.".contains) else { return nil }
+
         // Regex for "got 18/20", "scored 90%", "grade of 85"
-        let patternWithKeyword = #"(?:got|scored|received|grade of)\s*([0-9/.]+\s*(?:%|percent)?)"#
-        if let match = text.captureRegex(pattern: patternWithKeyword)?.last { return match.trimmingCharacters(in: .whitespaces) }
+        if let match = text.captureRegex(Self.scoreWithKeywordRegex)?.last { return match.trimmingCharacters(in: .whitespaces) }
         
         // Regex for "18/20" or "90%" when "worth" is NOT present, to avoid confusion with weight.
         if !text.lowercased().contains("worth") {
-            let patternWithoutKeyword = #"([0-9/.]+\s*(?:%|percent))"#
-            if let match = text.captureRegex(pattern: patternWithoutKeyword)?.last { return match.trimmingCharacters(in: .whitespaces) }
+            if let match = text.captureRegex(Self.scoreWithoutKeywordRegex)?.last { return match.trimmingCharacters(in: .whitespaces) }
         }
         return nil
     }
 
     private func extractWeight(from text: String) -> String? {
+        guard text.contains(where: "0123456789.".contains) else { return nil }
+
         // Regex for "worth 3%", "weight 10 percent"
-        let pattern = #"(?:worth|weight)\s*([0-9.]+\s*(?:%|percent)?)"#
-        if let match = text.captureRegex(pattern: pattern)?.last {
+        if let match = text.captureRegex(Self.weightRegex)?.last {
             return match.trimmingCharacters(in: .whitespacesAndNewlines)
         }
         return nil
@@ -269,9 +276,9 @@ public final class SmartInputEngine {
         let model: MLModel?
         let labelMapping: [String: String]
         switch intent {
-        case "grade_tracking": (model, labelMapping) = (gradeEntityModel, gradeLabelToKeyMap())
-        case "event_reminder": (model, labelMapping) = (eventEntityModel, eventLabelToKeyMap())
-        case "scheduled_event": (model, labelMapping) = (scheduleEntityModel, scheduleLabelToKeyMap())
+        case "grade_tracking": (model, labelMapping) = (gradeEntityModel, Self.gradeLabelToKeyMap)
+        case "event_reminder": (model, labelMapping) = (eventEntityModel, Self.eventLabelToKeyMap)
+        case "scheduled_event": (model, labelMapping) = (scheduleEntityModel, Self.scheduleLabelToKeyMap)
         default: return [:]
         }
 
@@ -371,9 +378,9 @@ public final class SmartInputEngine {
         }
     }
     
-    private func gradeLabelToKeyMap() -> [String: String] { ["ASSIGNMENT": "ASSIGNMENT", "SCORE_VALUE": "SCORE_VALUE", "COURSE_CODE": "COURSE_CODE", "MAX_SCORE": "MAX_SCORE", "COURSE_NAME": "COURSE_NAME", "LETTER_GRADE": "LETTER_GRADE", "COURSE_ALIAS": "COURSE_ALIAS", "WEIGHT_PERCENT": "WEIGHT_PERCENT"] }
-    private func eventLabelToKeyMap() -> [String: String] { ["EVENT": "EVENT", "DATE_ABS": "DATE_ABS", "REL_DURATION": "REL_DURATION", "DEADLINE_MARKER": "DEADLINE_MARKER", "DAY_OF_WEEK": "DAY_OF_WEEK", "TIME": "TIME", "DATE_REL": "DATE_REL", "REM_OFFSET": "REM_OFFSET", "CATEGORY": "CATEGORY"] }
-    private func scheduleLabelToKeyMap() -> [String: String] { ["EVENT": "EVENT", "REC_FREQ": "REC_FREQ", "DAY_OF_WEEK": "DAY_OF_WEEK", "TIME_START": "TIME_START", "REM_OFFSET": "REM_OFFSET", "CATEGORY": "CATEGORY", "REM_NEEDED": "REM_NEEDED", "TIME_END": "TIME_END", "INTERVAL": "INTERVAL"] }
+    private static let gradeLabelToKeyMap: [String: String] = ["ASSIGNMENT": "ASSIGNMENT", "SCORE_VALUE": "SCORE_VALUE", "COURSE_CODE": "COURSE_CODE", "MAX_SCORE": "MAX_SCORE", "COURSE_NAME": "COURSE_NAME", "LETTER_GRADE": "LETTER_GRADE", "COURSE_ALIAS": "COURSE_ALIAS", "WEIGHT_PERCENT": "WEIGHT_PERCENT"]
+    private static let eventLabelToKeyMap: [String: String] = ["EVENT": "EVENT", "DATE_ABS": "DATE_ABS", "REL_DURATION": "REL_DURATION", "DEADLINE_MARKER": "DEADLINE_MARKER", "DAY_OF_WEEK": "DAY_OF_WEEK", "TIME": "TIME", "DATE_REL": "DATE_REL", "REM_OFFSET": "REM_OFFSET", "CATEGORY": "CATEGORY"]
+    private static let scheduleLabelToKeyMap: [String: String] = ["EVENT": "EVENT", "REC_FREQ": "REC_FREQ", "DAY_OF_WEEK": "DAY_OF_WEEK", "TIME_START": "TIME_START", "REM_OFFSET": "REM_OFFSET", "CATEGORY": "CATEGORY", "REM_NEEDED": "REM_NEEDED", "TIME_END": "TIME_END", "INTERVAL": "INTERVAL"]
 
     // MARK: - Diagnostics
     public func debugBundleContents() { if let path = Bundle.main.resourcePath { do { let files = try FileManager.default.contentsOfDirectory(atPath: path); let ml = files.filter { $0.hasSuffix(".mlmodelc") };  ("🔎 Bundle ML files: \(ml.isEmpty ? "None found" : ml.joined(separator: ", "))") } catch {  ("❌ Bundle read error: \(error)") } } }
@@ -385,8 +392,7 @@ private func defaultCourseAliases() -> [String: String] { ["math": "Mathematics"
 
 // MARK: - String Extension
 private extension String {
-    func captureRegex(pattern: String) -> [String]? {
-        guard let re = try? NSRegularExpression(pattern: pattern, options: .caseInsensitive) else { return nil }
+    func captureRegex(_ re: NSRegularExpression) -> [String]? {
         let ns = self as NSString
         guard let match = re.firstMatch(in: self, options: [], range: NSRange(location: 0, length: ns.length)) else { return nil }
         return (1...match.numberOfRanges-1).map { ns.substring(with: match.range(at: $0)) }